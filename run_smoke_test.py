@@ -4,6 +4,8 @@ This module instantiates the market model, optionally checks the AnalystLLMAgent
 (LLM) availability, and runs a short simulation loop.
 """
 
+import numpy as np
+
 from src.core.config import SimConfig
 from src.network.topology import build_network
 from src.mesa_model.model import MarketModel
@@ -38,21 +40,24 @@ def main():
         print("[WARNING] No AnalystLLMAgent found in the model scheduler. Skipping LLM check.")
     else:
         try:
+            # A return above ``hold_threshold``, so the analyst cannot answer
+            # HOLD locally and must actually call the LLM.
             test_obs = Observation(
                 t=0,
                 price=model.market.price,
-                last_return=0.0,
-                neighbor_signals={
-                    ActionType.BUY: 0.0,
-                    ActionType.SELL: 0.0,
-                    ActionType.HOLD: 0.0,
-                },
+                last_return=0.01,
+                neighbor_signals=np.zeros(len(ActionType)),
                 analyst_signal=None,
             )
 
             print(f"[SYSTEM] Verifying LLM connection (Price: {test_obs.price:.2f})...")
             plan = analyst.plan(test_obs, "System Check")
-            print(f"[SUCCESS] Analyst responded: {plan.intended_action} (conf={plan.confidence:.2f})")
+            source = plan.meta.get("source")
+            if source == "groq":
+                print(f"[SUCCESS] Analyst responded: {plan.intended_action} (conf={plan.confidence:.2f}, source={source})")
+            else:
+                print(f"[WARNING] LLM check failed (source={source}): {plan.rationale}")
+                print("[INFO] Continuing without live LLM (fallback mode).")
 
         except Exception as e:
             print(f"[WARNING] LLM check failed: {e}")
@@ -1,12 +1,42 @@
+import asyncio
 import os
-import json
-from openai import OpenAI
+from collections import OrderedDict
+from dataclasses import replace
+from functools import lru_cache
+
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
 
-from ..core.types import Observation, Plan, Action, Outcome, ActionType
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional, faster drop-in for the JSON reply
+    from json import loads as json_loads
+
+from ..core.types import Observation, Plan, Action, Outcome, ActionType, NO_NEIGHBOR_SIGNALS
 from .base import BaseAgent
 
 
+_GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+
+
+@lru_cache(maxsize=1)
+def _groq_api_key() -> str | None:
+    """Read the Groq API key, loading the .env file only once per process."""
+    load_dotenv()
+    return os.getenv("GROQ_API_KEY")
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> OpenAI:
+    """
+    Sync Groq client shared by every analyst in the process, created on first use.
+    Reusing it keeps one HTTP keep-alive pool (TCP/TLS sessions) across agents and steps.
+    The async client is NOT shared this way: its connection pool is bound to the
+    event loop it first ran on (see ``AnalystLLMAgent.async_client``).
+    """
+    return OpenAI(base_url=_GROQ_BASE_URL, api_key=_groq_api_key())
+
+
 class AnalystLLMAgent(BaseAgent):
     """
     Analyst agent powered by Groq (LLaMA 3) as an OPTIONAL advisory component.
@@ -15,17 +45,42 @@ class AnalystLLMAgent(BaseAgent):
       with confidence and reasoning in JSON.
     - When unavailable, the agent falls back to a neutral HOLD recommendation.
     - The analyst does NOT trade; it only publishes advice and still completes the agentic loop.
+    - Recommendations are cached by the quantised market state (price, last return), so a repeated
+      state reuses the previous answer instead of issuing another API call. The memory summary is
+      not part of the key. Within one evolving run such repeats are rare; hits mostly come from
+      re-running the same market path with the same agent.
+    - Negligible price changes are answered with HOLD locally, as the prompt's strategy prescribes.
     """
 
-    def __init__(self, unique_id: int, model, memory_capacity: int = 50):
+    def __init__(self, unique_id: int, model, memory_capacity: int = 50, plan_cache_size: int = 256):
         super().__init__(unique_id, model, memory_capacity)
-        load_dotenv()
 
-        self.client = OpenAI(
-            base_url="https://api.groq.com/openai/v1",
-            api_key=os.getenv("GROQ_API_KEY"),
-        )
+        # Sync client for plan(), shared across analyst instances. The async twin
+        # used by plan_async() is created per event loop by ``async_client``.
+        self.client = _shared_client()
+        self._async_client: AsyncOpenAI | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
         self.llm_model = "llama-3.3-70b-versatile"
+        # Short, low-temperature answers: generation time grows with output tokens
+        self.max_tokens = 48
+        self.temperature = 0.2
+        # |last_return| below this is "tiny": strategy rule 3 answers HOLD without a call
+        self.hold_threshold = 1e-4
+
+        # Constant parts of the prompt; only the market data changes per call
+        self._prompt_prefix = "Context: You are a swing trader.\n"
+        self._prompt_suffix = (
+            "Strategy:\n"
+            "1. If Last change was POSITIVE (price went up), consider SELLING (Take Profit).\n"
+            "2. If Last change was NEGATIVE (price went down), consider BUYING (Buy Dip).\n"
+            "3. If change is tiny, HOLD.\n\n"
+            "The reasoning MUST be at most 10 words.\n"
+            "Respond ONLY JSON: {\"action\": \"BUY\", \"confidence\": 0.9, \"reasoning\": \"reason\"}"
+        )
+
+        # LRU cache of Groq recommendations keyed by a quantised observation
+        self.plan_cache_size = plan_cache_size
+        self._plan_cache: OrderedDict[tuple, Plan] = OrderedDict()
 
         # Buffers to complete the agentic loop across stages
         self._last_obs: Observation | None = None
@@ -33,6 +88,20 @@ class AnalystLLMAgent(BaseAgent):
         self._published_action: Action | None = None
         self._outcome: Outcome | None = None
 
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """
+        Async Groq client for the running event loop.
+        Its HTTP pool only works on the loop it was created on, so a new client is
+        made whenever plan_async() runs under a different loop (e.g. a second
+        ``asyncio.run``); within one loop the client and its connections are reused.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = AsyncOpenAI(base_url=_GROQ_BASE_URL, api_key=_groq_api_key())
+            self._async_loop = loop
+        return self._async_client
+
     # -------------------------
     # Stage 1: decide
     # -------------------------
@@ -48,7 +117,7 @@ class AnalystLLMAgent(BaseAgent):
     def observe(self) -> Observation:
         """
         The analyst observes ONLY market-level state.
-        It does not use social neighbour signals (set to zeros).
+        It does not use social neighbour signals (shared all-zero vector).
         """
         base_obs = self.model.get_observation()
 
@@ -56,11 +125,7 @@ class AnalystLLMAgent(BaseAgent):
             t=base_obs.t,
             price=base_obs.price,
             last_return=base_obs.last_return,
-            neighbor_signals={
-                ActionType.BUY: 0.0,
-                ActionType.SELL: 0.0,
-                ActionType.HOLD: 0.0,
-            },
+            neighbor_signals=NO_NEIGHBOR_SIGNALS,
             analyst_signal=None,
         )
 
@@ -68,46 +133,107 @@ class AnalystLLMAgent(BaseAgent):
         """
         Call Groq for a structured JSON recommendation when available.
         Fallback to HOLD if API fails or key is missing.
+        Tiny price changes short-circuit to HOLD and repeated (quantised)
+        observations are served from the plan cache.
         """
-        prompt = (
-            "Context: You are a swing trader.\n"
-            f"Market Data: Price is {obs.price:.2f}. Last change was {obs.last_return:.4f}.\n"
-            f"Recent memory summary:\n{recalled}\n\n"
-            "Strategy:\n"
-            "1. If Last change was POSITIVE (price went up), consider SELLING (Take Profit).\n"
-            "2. If Last change was NEGATIVE (price went down), consider BUYING (Buy Dip).\n"
-            "3. If change is tiny, HOLD.\n\n"
-            "Respond ONLY JSON: {\"action\": \"BUY\", \"confidence\": 0.9, \"reasoning\": \"reason\"}"
-        )
+        key = self._cache_key(obs, recalled)
+        plan = self._shortcut_plan(obs) or self._cached_plan(key)
+        if plan is None:
+            try:
+                response = self.client.chat.completions.create(**self._request(obs, recalled))
+                plan = self._store_plan(key, self._parse_response(response))
+            except Exception as e:
+                plan = self._fallback_plan(e)
+
+        # store for reflection
+        self._last_obs = obs
+        self._last_plan = plan
+        return plan
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.llm_model,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-            )
-            data = json.loads(response.choices[0].message.content)
-
-            plan = Plan(
-                intended_action=ActionType(data["action"]),
-                confidence=float(data["confidence"]),
-                rationale=data["reasoning"],
-                meta={"source": "groq"},
-            )
-
-        except Exception as e:
-            plan = Plan(
-                intended_action=ActionType.HOLD,
-                confidence=0.5,
-                rationale=f"[FALLBACK] HOLD. Reason: {e}",
-                meta={"source": "fallback"},
-            )
+    async def plan_async(self, obs: Observation, recalled: str) -> Plan:
+        """
+        Same as ``plan`` but awaits the async Groq client, so the HTTP round-trip
+        can overlap with other work (e.g. the Mesa step) instead of blocking it.
+        """
+        key = self._cache_key(obs, recalled)
+        plan = self._shortcut_plan(obs) or self._cached_plan(key)
+        if plan is None:
+            try:
+                response = await self.async_client.chat.completions.create(**self._request(obs, recalled))
+                plan = self._store_plan(key, self._parse_response(response))
+            except Exception as e:
+                plan = self._fallback_plan(e)
 
         # store for reflection
         self._last_obs = obs
         self._last_plan = plan
         return plan
 
+    # -------------------------
+    # Groq request helpers
+    # -------------------------
+    def _shortcut_plan(self, obs: Observation) -> Plan | None:
+        if abs(obs.last_return) >= self.hold_threshold:
+            return None
+        return Plan(
+            intended_action=ActionType.HOLD,
+            confidence=0.5,
+            rationale=f"[SHORTCUT] HOLD. |last change| < {self.hold_threshold:g}",
+            meta={"source": "shortcut"},
+        )
+
+    def _cache_key(self, obs: Observation, recalled: str) -> tuple:
+        # Market fields only: the memory summary carries the step number and
+        # PnL, so it differs every step and would prevent any hit for the
+        # scheduled analyst; the prompt's strategy depends on the market data.
+        return (round(obs.price, 2), round(obs.last_return, 4))
+
+    def _cached_plan(self, key: tuple) -> Plan | None:
+        cached = self._plan_cache.get(key)
+        if cached is None:
+            return None
+        self._plan_cache.move_to_end(key)
+        return replace(cached, meta={"source": "cache"})
+
+    def _store_plan(self, key: tuple, plan: Plan) -> Plan:
+        # only successful answers are cached; fallbacks are retried next time
+        self._plan_cache[key] = plan
+        if len(self._plan_cache) > self.plan_cache_size:
+            self._plan_cache.popitem(last=False)
+        return plan
+
+    def _request(self, obs: Observation, recalled: str) -> dict:
+        prompt = (
+            f"{self._prompt_prefix}"
+            f"Market Data: Price is {obs.price:.2f}. Last change was {obs.last_return:.4f}.\n"
+            f"Recent memory summary:\n{recalled}\n\n"
+            f"{self._prompt_suffix}"
+        )
+        return {
+            "model": self.llm_model,
+            "messages": [{"role": "user", "content": prompt}],
+            "response_format": {"type": "json_object"},
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+        }
+
+    def _parse_response(self, response) -> Plan:
+        data = json_loads(response.choices[0].message.content)
+        return Plan(
+            intended_action=ActionType[data["action"]],
+            confidence=float(data["confidence"]),
+            rationale=data["reasoning"],
+            meta={"source": "groq"},
+        )
+
+    def _fallback_plan(self, e: Exception) -> Plan:
+        return Plan(
+            intended_action=ActionType.HOLD,
+            confidence=0.5,
+            rationale=f"[FALLBACK] HOLD. Reason: {e}",
+            meta={"source": "fallback"},
+        )
+
     def act(self, plan: Plan) -> Action:
         """
         Publish the analyst recommendation to the model.
@@ -12,7 +12,7 @@ based on past performance and network feedback.
 
 from typing import Optional
 
-from ..core.types import Observation, Plan, Action, Outcome, ActionType
+from ..core.types import Observation, Plan, Action, Outcome, ActionType, TradeReflection
 from .base import BaseAgent
 
 
@@ -25,6 +25,9 @@ class InvestorAgent(BaseAgent):
     decisions, plan an action influenced by momentum, social pressure,
     and risk aversion, execute trades during the settlement stage, and
     finally reflect on realised profit and loss to update their memory.
+
+    Portfolio state and the numeric decision rule live in the model's
+    ``InvestorState`` arrays; each agent is a view over row ``unique_id``.
     """
 
     def __init__(
@@ -58,9 +61,11 @@ class InvestorAgent(BaseAgent):
         """
         super().__init__(unique_id, model, memory_capacity)
 
-        self._analyst_plan = None
-
         self.profile = profile
+
+        # Row of this agent in the model-owned structure-of-arrays state.
+        self._state = model.investor_soa
+        self._row = unique_id
         self.risk_aversion = float(risk_aversion)
 
         # Portfolio state: cash and risky-asset holdings.
@@ -76,6 +81,36 @@ class InvestorAgent(BaseAgent):
         # Last mark-to-market wealth used to compute incremental PnL.
         self._last_wealth = self._mark_to_market()
 
+    # -------------------------
+    # Row views into InvestorState
+    # -------------------------
+    @property
+    def risk_aversion(self) -> float:
+        """Risk aversion in ``[0, 1]``."""
+        return float(self._state.risk_aversion[self._row])
+
+    @risk_aversion.setter
+    def risk_aversion(self, value: float) -> None:
+        self._state.risk_aversion[self._row] = value
+
+    @property
+    def cash(self) -> float:
+        """Cash available to finance trades."""
+        return float(self._state.cash[self._row])
+
+    @cash.setter
+    def cash(self, value: float) -> None:
+        self._state.cash[self._row] = value
+
+    @property
+    def shares(self) -> float:
+        """Holdings of the risky asset."""
+        return float(self._state.shares[self._row])
+
+    @shares.setter
+    def shares(self, value: float) -> None:
+        self._state.shares[self._row] = value
+
     # -------------------------
     # Helpers
     # -------------------------
@@ -88,10 +123,18 @@ class InvestorAgent(BaseAgent):
     # Stage 1: decide
     # -------------------------
     def decide(self) -> None:
-        """Execute the Observe–Recall–Plan–Act phases of the agentic loop."""
+        """Execute the Observe–Recall–Plan–Act phases of the agentic loop.
+
+        The numeric decisions of all investors are computed in a single
+        vectorised pass by ``MarketModel.decide_investors`` (which also
+        publishes the actions for social diffusion); this agent then wraps
+        its own row into the episode objects kept for reflection.
+        """
+        self.model.decide_investors()
+
         obs = self.observe()
         recalled = self.recall(obs)
-        plan = self.plan(obs, recalled)
+        plan = self._plan_from_state(recalled)
         action = self.act(plan)
 
         # Cache the episode for the subsequent reflection stage.
@@ -99,17 +142,18 @@ class InvestorAgent(BaseAgent):
         self._last_plan = plan
         self._pending_action = action
 
-        # Publish the discrete action for social diffusion on the network.
-        self.model.last_actions[self.unique_id] = action.action
-
     def observe(self) -> Observation:
         """Construct an observation combining market, network, and analyst signals."""
         env = self.model.market
-        neighbor_signals = self.model.get_neighbor_signals(self.unique_id)
-        
+        if self.model.decided_this_step():
+            # Social inputs of this step's batched pass; copy the row, as
+            # the state array is overwritten at the next step.
+            neighbor_signals = self._state.signals[self._row].copy()
+        else:
+            neighbor_signals = self.model.get_neighbor_signals(self.unique_id)
+
         analyst_signal = self.model.get_latest_analyst_signal()  # text
-        self._analyst_plan = getattr(self.model, "analyst_recommendation", None)  # structured Plan
-        
+
         return Observation(
             t=self.model.schedule.time,
             price=env.price,
@@ -119,49 +163,52 @@ class InvestorAgent(BaseAgent):
         )
 
     def plan(self, obs: Observation, recalled: str) -> Plan:
-        """Map observations and memory into a discrete trading plan."""
-        
-        # 1. Momentum Component
-        if obs.last_return > 0:
-            momentum = 1.0
-        elif obs.last_return < 0:
-            momentum = -1.0
-        else:
-            momentum = 0.0
-
-        # 2. Social Component
-        buy_p = obs.neighbor_signals.get(ActionType.BUY, 0.0)
-        sell_p = obs.neighbor_signals.get(ActionType.SELL, 0.0)
-        social = buy_p - sell_p
-
-        # 3. Analyst Component
-        analyst_val = 0.0
-        signal_action = None
-        if self._analyst_plan is not None:
-            signal_action = self._analyst_plan.intended_action
-
-            
-            if signal_action == ActionType.BUY:
-                analyst_val = 1.0
-            elif signal_action == ActionType.SELL:
-                analyst_val = -1.0
-
-        # Combined score
-        score = 0.3 * momentum + 0.2 * social + 0.5 * analyst_val
-
-        # Risk control: more risk-averse agents downscale the score.
-        score *= (1.0 - self.risk_aversion)
-
-        # Map the continuous score to a discrete trading intention.
-        if score > 0.15:
-            intended = ActionType.BUY
-        elif score < -0.15:
-            intended = ActionType.SELL
-        else:
-            intended = ActionType.HOLD
+        """Map observations and memory into a discrete trading plan.
+
+        The score combines momentum (0.3), social pressure (0.2) and the
+        analyst recommendation (0.5), scaled down by risk aversion. It is
+        evaluated for ``obs`` with the same kernel that ``InvestorState``
+        applies to the whole population during the ``decide`` stage.
+        """
+        analyst_val = self.model.analyst_value()
+        intended, score, confidence, social, momentum = self._state.evaluate(
+            self._row, obs.last_return, obs.neighbor_signals, analyst_val
+        )
+        return self._make_plan(
+            intended, confidence, score, momentum, social, analyst_val,
+            float(obs.neighbor_signals[ActionType.BUY]),
+            float(obs.neighbor_signals[ActionType.SELL]),
+            recalled,
+        )
 
-        confidence = min(1.0, max(0.05, abs(score)))
+    def _plan_from_state(self, recalled: str) -> Plan:
+        """Build the plan from this agent's row of the current batched pass."""
+        st, i = self._state, self._row
+        return self._make_plan(
+            ActionType(int(st.action[i])),
+            float(st.confidence[i]),
+            float(st.score[i]),
+            st.momentum,
+            float(st.social[i]),
+            st.analyst_val,
+            float(st.signals[i, ActionType.BUY]),
+            float(st.signals[i, ActionType.SELL]),
+            recalled,
+        )
 
+    def _make_plan(
+        self,
+        intended: ActionType,
+        confidence: float,
+        score: float,
+        momentum: float,
+        social: float,
+        analyst_val: float,
+        buy_p: float,
+        sell_p: float,
+        recalled: str,
+    ) -> Plan:
+        """Assemble a ``Plan`` with its rationale from the rule's components."""
         rationale = (
             f"momentum={momentum:.2f}, social={social:.2f}, analyst={analyst_val:.2f}, "
             f"risk_aversion={self.risk_aversion:.2f}, score={score:.2f}\n"
@@ -261,11 +308,15 @@ class InvestorAgent(BaseAgent):
         # NOTE: keep _outcome for one global step so MarketModel can update trust weights
         # self._outcome = None
 
-    def reflect_text(self, obs: Observation, plan: Plan, action: Action, outcome: Outcome) -> str:
-        """Generate a concise textual reflection on the realised outcome."""
-        good = outcome.pnl >= 0
-        return (
-            f"{'GOOD' if good else 'BAD'} decision. pnl={outcome.pnl:.2f}. "
-            f"Action={action.action}, size={action.size:.2f}. "
-            f"Consider adjusting thresholds or position sizing under high volatility."
+    def reflect_text(self, obs: Observation, plan: Plan, action: Action, outcome: Outcome) -> TradeReflection:
+        """Generate a concise reflection on the realised outcome.
+
+        The returned ``TradeReflection`` renders the textual reflection on
+        ``str()``, so no string is built unless the memory is inspected.
+        """
+        return TradeReflection(
+            good=outcome.pnl >= 0,
+            pnl=outcome.pnl,
+            action=action.action,
+            size=action.size,
         )
\ No newline at end of file
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+"""Structure-of-arrays storage for the investor population.
+
+``InvestorState`` keeps the portfolio, preference, and per-step decision
+variables of all investors in contiguous NumPy arrays owned by the
+``MarketModel``. Row ``i`` belongs to the investor with ``unique_id ==
+i``; ``InvestorAgent`` instances act as thin views over their row. This
+allows the decision stage to score every investor in a single vectorised
+pass instead of one Python call chain per agent.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from ..core.kernels import compute_investor_decisions
+from ..core.types import ActionType
+
+
+@dataclass
+class InvestorState:
+    """Per-investor arrays, indexed by investor id.
+
+    Portfolio and preference arrays (``risk_aversion``, ``cash``,
+    ``shares``) persist across steps. The social input ``signals`` (one
+    row of neighbour action shares per investor, columns indexed by
+    ``ActionType``) and the decision outputs (``action``, ``score``,
+    ``confidence``, ``size``, ``social``) are overwritten on every call
+    to ``decide``.
+    """
+
+    n: int
+
+    def __post_init__(self) -> None:
+        """Allocate all arrays for ``n`` investors."""
+        n = self.n
+        self.risk_aversion = np.zeros(n, dtype=np.float64)
+        self.cash = np.zeros(n, dtype=np.float64)
+        self.shares = np.zeros(n, dtype=np.float64)
+
+        # Weighted neighbour action shares, filled before each decision pass.
+        self.signals = np.zeros((n, len(ActionType)), dtype=np.float64)
+
+        # Decision outputs; ``action`` holds ``ActionType`` codes.
+        self.action = np.zeros(n, dtype=np.int8)
+        self.score = np.zeros(n, dtype=np.float64)
+        self.confidence = np.zeros(n, dtype=np.float64)
+        self.size = np.zeros(n, dtype=np.float64)
+        self.social = np.zeros(n, dtype=np.float64)
+        self.momentum = 0.0
+        self.analyst_val = 0.0
+
+    def evaluate(
+        self, row: int, last_return: float, signals: np.ndarray, analyst_val: float
+    ) -> Tuple[ActionType, float, float, float, float]:
+        """Apply the decision rule to a single investor and explicit inputs.
+
+        Runs the same kernel as ``decide`` on one row, with ``signals``
+        (neighbour action shares indexed by ``ActionType``) in place of the
+        stored social inputs; no state arrays are modified. Returns the
+        action, score, confidence, social pressure and momentum.
+        """
+        action = np.zeros(1, dtype=np.int8)
+        score, confidence, size, social = (np.zeros(1) for _ in range(4))
+        momentum = compute_investor_decisions(
+            float(last_return),
+            np.asarray(signals, dtype=np.float64).reshape(1, len(ActionType)),
+            float(analyst_val),
+            self.risk_aversion[row:row + 1],
+            action,
+            score,
+            confidence,
+            size,
+            social,
+        )
+        return (
+            ActionType(int(action[0])),
+            float(score[0]),
+            float(confidence[0]),
+            float(social[0]),
+            float(momentum),
+        )
+
+    def decide(self, last_return: float, analyst_val: float) -> None:
+        """Score all investors and derive their actions and position sizes.
+
+        Applies the investor decision rule (momentum, social pressure and
+        analyst components, attenuated by risk aversion) to every row via
+        the compiled ``compute_investor_decisions`` kernel. ``last_return``
+        and ``analyst_val`` are shared by the whole population; the social
+        inputs must already be filled in.
+        """
+        self.analyst_val = float(analyst_val)
+        self.momentum = compute_investor_decisions(
+            float(last_return),
+            self.signals,
+            self.analyst_val,
+            self.risk_aversion,
+            self.action,
+            self.score,
+            self.confidence,
+            self.size,
+            self.social,
+        )
@@ -0,0 +1,32 @@
+"""Ahead-of-time build of the numerical kernels in ``kernels.py``.
+
+Run ``python -m src.core._compile_kernels`` from the project root to
+compile the ``investor_kernels`` extension module next to this file.
+``kernels.py`` imports it when present, so fresh processes skip the Numba
+JIT warm-up; without it the JIT (or plain Python) kernel is used. The
+build requires Numba and a C compiler; the result is platform specific
+and is not committed.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from . import kernels
+
+# Argument types must match the arrays allocated by ``InvestorState``.
+INVESTOR_DECISIONS_SIG = "f8(f8, f8[:, :], f8, f8[:], i1[:], f8[:], f8[:], f8[:], f8[:])"
+
+
+def build() -> None:
+    """Compile the investor decision kernel into ``investor_kernels``."""
+    cc = CC("investor_kernels")
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+    kernel = kernels._jit_compute_investor_decisions
+    cc.export("compute_investor_decisions", INVESTOR_DECISIONS_SIG)(getattr(kernel, "py_func", kernel))
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
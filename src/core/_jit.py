@@ -0,0 +1,20 @@
+"""Optional Numba support for the numerical kernels.
+
+Numba is an optional accelerator. When it is installed, ``njit`` is the
+real Numba decorator; otherwise it leaves the decorated function
+untouched, so the kernels still run (more slowly) as ordinary Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -9,7 +9,8 @@ episode storage and summarisation to an ``AgentMemory`` instance.
 """
 
 from abc import ABC, abstractmethod
-from .types import Observation, Plan, Action, Outcome, MemoryItem
+from typing import Union
+from .types import Observation, Plan, Action, Outcome, MemoryItem, TradeReflection
 from .memory import AgentMemory
 
 
@@ -47,7 +48,14 @@ class AgenticLoop(ABC):
     @abstractmethod
     def reflect(self, obs: Observation, plan: Plan, action: Action, outcome: Outcome) -> str: ...
 
-    def update(self, obs: Observation, plan: Plan, action: Action, outcome: Outcome, reflection: str) -> None:
+    def update(
+        self,
+        obs: Observation,
+        plan: Plan,
+        action: Action,
+        outcome: Outcome,
+        reflection: Union[str, TradeReflection],
+    ) -> None:
         """Store a completed decision episode in memory."""
         item = MemoryItem(
             t=obs.t,
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+"""Compiled numerical kernels for the agent population.
+
+Kernels operate on the NumPy arrays of ``InvestorState`` and write their
+results into caller-provided output arrays, so no temporaries are
+allocated per step. Actions are encoded as ``int8`` ``ActionType`` codes
+(0 = HOLD, 1 = BUY, 2 = SELL) inside the kernels.
+
+If the ahead-of-time build from ``_compile_kernels.py`` is present, its
+compiled kernels replace the JIT versions, avoiding warm-up at start-up.
+"""
+
+from ._jit import njit
+from .types import ActionType
+
+_HOLD = int(ActionType.HOLD)
+_BUY = int(ActionType.BUY)
+_SELL = int(ActionType.SELL)
+
+
+@njit(cache=True)
+def compute_investor_decisions(
+    last_return,
+    signals,
+    analyst_val,
+    risk_aversion,
+    out_action,
+    out_score,
+    out_confidence,
+    out_size,
+    out_social,
+):
+    """Score every investor and derive action code, confidence and size.
+
+    The score combines momentum (sign of ``last_return``), social
+    pressure (BUY minus SELL share of ``signals``, an ``(n, 3)`` array
+    indexed by action code) and the analyst signal, downscaled by risk
+    aversion; scores beyond ``±0.15`` map to BUY/SELL. Returns the shared
+    momentum term.
+    """
+    if last_return > 0:
+        momentum = 1.0
+    elif last_return < 0:
+        momentum = -1.0
+    else:
+        momentum = 0.0
+
+    for i in range(signals.shape[0]):
+        social = signals[i, _BUY] - signals[i, _SELL]
+        score = 0.3 * momentum + 0.2 * social + 0.5 * analyst_val
+        score *= 1.0 - risk_aversion[i]
+
+        if score > 0.15:
+            code = _BUY
+        elif score < -0.15:
+            code = _SELL
+        else:
+            code = _HOLD
+
+        confidence = min(1.0, max(0.05, abs(score)))
+        size = min(0.5, 0.1 + 0.4 * confidence) * (1.0 - 0.5 * risk_aversion[i])
+
+        out_action[i] = code
+        out_score[i] = score
+        out_confidence[i] = confidence
+        out_size[i] = max(0.0, min(0.5, size))
+        out_social[i] = social
+
+    return momentum
+
+
+# The JIT kernel is kept addressable for the ahead-of-time build.
+_jit_compute_investor_decisions = compute_investor_decisions
+
+try:
+    from .investor_kernels import compute_investor_decisions  # noqa: F811
+except ImportError:
+    pass
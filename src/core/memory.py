@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque, List, Optional
+from itertools import islice
+from typing import Deque, Dict, List, Optional
 from .types import MemoryItem
 
 
@@ -23,10 +24,13 @@ class AgentMemory:
     def __post_init__(self) -> None:
         """Initialise the underlying bounded deque."""
         self._items: Deque[MemoryItem] = deque(maxlen=self.capacity)
+        # Summary text per ``k``, valid until the next episode is added.
+        self._summaries: Dict[int, str] = {}
 
     def add(self, item: MemoryItem) -> None:
         """Append a new decision episode to memory."""
         self._items.append(item)
+        self._summaries.clear()
 
     def last(self) -> Optional[MemoryItem]:
         """Return the most recently stored episode, if any."""
@@ -41,15 +45,24 @@ class AgentMemory:
 
         The summary is intentionally terse and structured so that it can
         be used as context for an LLM or other downstream components
-        without exposing the full memory contents.
+        without exposing the full memory contents. Only the last ``k``
+        items are visited, and the text is reused until memory changes.
         """
-        tail = list(self._items)[-k:]
+        cached = self._summaries.get(k)
+        if cached is not None:
+            return cached
+
+        tail = list(islice(reversed(self._items), k))
         if not tail:
-            return "No prior decisions."
-        lines = []
-        for it in tail:
-            lines.append(
-                f"t={it.t} act={it.action.action} size={it.action.size:.2f} pnl={it.outcome.pnl:.2f} "
-                f"wealth={it.outcome.new_wealth:.2f} conf={it.plan.confidence:.2f}"
-            )
-        return "\n".join(lines)
+            summary = "No prior decisions."
+        else:
+            lines = []
+            for it in reversed(tail):
+                lines.append(
+                    f"t={it.t} act={it.action.action} size={it.action.size:.2f} pnl={it.outcome.pnl:.2f} "
+                    f"wealth={it.outcome.new_wealth:.2f} conf={it.plan.confidence:.2f}"
+                )
+            summary = "\n".join(lines)
+
+        self._summaries[k] = summary
+        return summary
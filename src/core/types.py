@@ -1,32 +1,56 @@
 from __future__ import annotations
 
-"""Typed data structures used throughout the agentic model."""
+"""Typed data structures used throughout the agentic model.
+
+The records below are created for every agent at every step, so they are
+frozen, slotted dataclasses without a per-instance ``__dict__``.
+"""
 
 from dataclasses import dataclass
-from enum import Enum
-from typing import Optional, Dict, Any, List
+from enum import IntEnum
+from typing import Optional, Dict, Any, List, Union
+
+import numpy as np
+
+
+class ActionType(IntEnum):
+    """Discrete action types available to investor and analyst agents.
+
+    Members are small integers so that they can index NumPy arrays (such
+    as neighbour signal vectors and action counts) directly and be stored
+    as ``int8`` codes in vectorised agent state.
+    """
+
+    HOLD = 0
+    BUY = 1
+    SELL = 2
+
+    def __str__(self) -> str:
+        """Render as ``ActionType.<NAME>`` rather than the integer value."""
+        return f"{type(self).__name__}.{self.name}"
 
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
 
-class ActionType(str, Enum):
-    """Discrete action types available to investor and analyst agents."""
 
-    BUY = "BUY"
-    SELL = "SELL"
-    HOLD = "HOLD"
+# Shared, read-only neighbour signal for observers without neighbours, so
+# that such observations do not allocate a fresh zero vector every step.
+NO_NEIGHBOR_SIGNALS = np.zeros(len(ActionType))
+NO_NEIGHBOR_SIGNALS.flags.writeable = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Observation:
     """Snapshot of information available to an agent at decision time."""
 
     t: int
     price: float
     last_return: float
-    neighbor_signals: Dict[ActionType, float]
+    neighbor_signals: np.ndarray                # Weighted neighbour action shares, indexed by ActionType.
     analyst_signal: Optional[str] = None       # Textual recommendation from the analyst.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Plan:
     """Internal representation of an agent's intended action."""
 
@@ -36,7 +60,7 @@ class Plan:
     meta: Dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Action:
     """Executable trading or signalling action derived from a plan."""
 
@@ -45,7 +69,7 @@ class Action:
     rationale: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Outcome:
     """Realised financial outcome of executing an action."""
 
@@ -55,7 +79,28 @@ class Outcome:
     price: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class TradeReflection:
+    """Investor reflection on a trade, formatted as text only when read.
+
+    Reflections are stored for every agent at every step but rarely
+    rendered, so the text is produced lazily by ``str()``.
+    """
+
+    good: bool
+    pnl: float
+    action: ActionType
+    size: float
+
+    def __str__(self) -> str:
+        return (
+            f"{'GOOD' if self.good else 'BAD'} decision. pnl={self.pnl:.2f}. "
+            f"Action={self.action}, size={self.size:.2f}. "
+            f"Consider adjusting thresholds or position sizing under high volatility."
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class MemoryItem:
     """Complete record of a single decision episode for memory storage."""
 
@@ -64,5 +109,5 @@ class MemoryItem:
     plan: Plan
     action: Action
     outcome: Outcome
-    reflection: str
+    reflection: Union[str, TradeReflection]
     tags: List[str]
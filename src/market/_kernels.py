@@ -0,0 +1,17 @@
+"""Compiled price-update kernel for the market environment."""
+
+import math
+
+from ..core._jit import njit
+
+
+@njit(cache=True)
+def gbm_step(price, drift_term, vol_term, z, flow):
+    """Advance ``price`` by one GBM step with linear order-flow impact.
+
+    ``drift_term`` is ``(mu - sigma**2 / 2) * dt`` and ``vol_term`` is
+    ``sigma * sqrt(dt)``; ``z`` is a standard normal shock and ``flow``
+    the net order flow. Returns the new price and the realised log return.
+    """
+    ret = drift_term + vol_term * z + 0.001 * flow
+    return price * math.exp(ret), ret
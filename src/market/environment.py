@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
-import random
+
+import numpy as np
+
+from ._kernels import gbm_step
+
+# Number of standard normal shocks drawn per refill of the shock buffer.
+_SHOCK_BLOCK = 4096
 
 @dataclass
 class MarketEnvironment:
@@ -21,26 +27,35 @@ class MarketEnvironment:
     seed: int = 42
 
     def __post_init__(self) -> None:
-        """Initialize the random number generator and return state."""
-        self.rng = random.Random(self.seed)
+        """Initialize the random number generator, return state and GBM terms."""
+        self.rng = np.random.default_rng(self.seed)
         self.last_return = 0.0
 
+        # Pre-drawn standard normal shocks, consumed one per step.
+        self._z_buf = self.rng.standard_normal(_SHOCK_BLOCK)
+        self._z_idx = 0
+
+        # Deterministic drift and volatility scale of the GBM return; the
+        # parameters are fixed for the lifetime of the environment.
+        self._drift_term = (self.mu - 0.5 * self.sigma**2) * self.dt
+        self._vol_term = self.sigma * math.sqrt(self.dt)
+
     def step(self, net_order_flow: float) -> None:
         """Advance the market price by one time step.
         
         Combines a stochastic GBM term with a linear market impact term 
         derived from net investor activity.
         """
-        # Random shock from a standard normal distribution
-        z = self.rng.gauss(0.0, 1.0)
-        
-        # Calculate the GBM component of the return
-        gbm_ret = (self.mu - 0.5 * self.sigma**2) * self.dt + self.sigma * math.sqrt(self.dt) * z
-        
-        # Calculate market impact from order flow
-        impact = 0.001 * net_order_flow 
-        
-        # Update price and record the realized return
-        ret = gbm_ret + impact
-        self.last_return = ret
-        self.price *= math.exp(ret)
\ No newline at end of file
+        # Random shock from a standard normal distribution, taken from the
+        # pre-drawn block (refilled when exhausted)
+        if self._z_idx == self._z_buf.size:
+            self._z_buf = self.rng.standard_normal(_SHOCK_BLOCK)
+            self._z_idx = 0
+        z = float(self._z_buf[self._z_idx])
+        self._z_idx += 1
+
+        # GBM return plus order-flow impact, evaluated by the compiled kernel;
+        # update price and record the realized return
+        self.price, self.last_return = gbm_step(
+            self.price, self._drift_term, self._vol_term, z, float(net_order_flow)
+        )
\ No newline at end of file
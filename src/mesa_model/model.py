@@ -12,17 +12,60 @@ agentic behaviour, memory, and network effects.
 
 from mesa import Model
 import networkx as nx
-from typing import Dict, Optional, Any, List
+import numpy as np
+from collections.abc import Iterator, Mapping
+import threading
+import random
+from typing import Dict, List, Optional
 
 from .schedule import StagedScheduler
 from ..market.environment import MarketEnvironment
 from ..network.influence import neighbor_action_distribution
-from ..network.metrics import compute_network_metrics
-from ..core.types import ActionType
+from ..network.metrics import compute_dynamic_metrics, compute_static_metrics, detect_communities
+from ..core.types import ActionType, NO_NEIGHBOR_SIGNALS
 from ..agents.investor import InvestorAgent
+from ..agents.investor_state import InvestorState
 from ..agents.analyst import AnalystLLMAgent
 
-from ..network.evolution import update_trust_weights
+from ..network.evolution import (
+    TRUST_W_MAX,
+    TRUST_W_MIN,
+    rewire_by_performance,
+    update_trust_weights,
+)
+
+# Order-flow direction per action code: BUY +1, SELL -1, HOLD 0.
+_FLOW_SIGN = np.zeros(len(ActionType))
+_FLOW_SIGN[ActionType.BUY] = 1.0
+_FLOW_SIGN[ActionType.SELL] = -1.0
+
+# One row of the simulation history: price and aggregate network metrics.
+_HISTORY_DTYPE = np.dtype([
+    ("t", np.int64),
+    ("price", np.float64),
+    ("avg_degree", np.float64),
+    ("avg_clustering", np.float64),
+    ("modularity", np.float64),
+])
+_NET_METRIC_FIELDS = ["t", "avg_degree", "avg_clustering", "modularity"]
+
+
+class _ActionCodesView(Mapping):
+    """Read-only ``{investor id: ActionType}`` view over an action-code array."""
+
+    def __init__(self, codes: np.ndarray) -> None:
+        self._codes = codes
+
+    def __getitem__(self, key: int) -> ActionType:
+        if not isinstance(key, (int, np.integer)) or not 0 <= key < len(self._codes):
+            raise KeyError(key)
+        return ActionType(int(self._codes[key]))
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self._codes)))
+
+    def __len__(self) -> int:
+        return len(self._codes)
 
 
 class MarketModel(Model):
@@ -40,52 +83,127 @@ class MarketModel(Model):
     seed:
         Random seed used to initialise the market environment and any
         other stochastic components.
+    max_workers:
+        Optional thread-pool size for the scheduler's independent stages
+        (currently ``decide`` and ``reflect``); ``None`` runs every stage
+        sequentially.
+        ``os.cpu_count()`` is a sensible value for large populations.
     """
 
-    def __init__(self, G: nx.Graph, n_investors: int, seed: int = 42) -> None:
+    # (profile, risk aversion) per investor type, assigned round-robin by id.
+    _PROFILES = (
+        ("risk_averse", 0.8),
+        ("moderate", 0.5),
+        ("speculative", 0.2),
+    )
+
+    def __init__(self, G: nx.Graph, n_investors: int, seed: int = 42, max_workers: Optional[int] = None) -> None:
         super().__init__()
         self.seed = seed
         self.network = G
-        self.schedule = StagedScheduler(self)
+        self.schedule = StagedScheduler(self, max_workers=max_workers)
 
         # Market environment for the traded asset.
         self.market = MarketEnvironment(seed=seed)
 
         # Shared state used by agents to coordinate decisions.
-        self.last_actions: Dict[int, ActionType] = {}
         self.latest_analyst_signal: Optional[str] = None
 
-        # Time series used for ex post analysis of prices and network state.
-        self.price_history: List[float] = []
-        self.net_metrics_history: List[Dict[str, Any]] = []
+        # Portfolio and decision arrays for all investors (row i = investor i).
+        self.investor_soa = InvestorState(n_investors)
+        self._decided_at: Optional[int] = None
+        self._decide_lock = threading.Lock()
+
+        # Time series used for ex post analysis of prices and network state,
+        # one structured row per step; grown geometrically as needed.
+        self._history = np.zeros(64, dtype=_HISTORY_DTYPE)
+        self._history_len = 0
 
         # Single global analyst agent that is not embedded in the social graph.
         analyst = AnalystLLMAgent(unique_id=10_000, model=self)
         self.schedule.add(analyst)
 
         # Create investors aligned with graph nodes 0..n-1.
+        self._investors: List[InvestorAgent] = []
         for i in range(n_investors):
             profile, ra = self._assign_profile(i)
             inv = InvestorAgent(unique_id=i, model=self, profile=profile, risk_aversion=ra)
             self.schedule.add(inv)
-            self.last_actions[i] = ActionType.HOLD
+            self._investors.append(inv)
+
+        # Number of investors per action in ``last_actions``, indexed by ActionType.
+        self.action_counts = np.zeros(len(ActionType), dtype=np.int64)
+        self.action_counts[ActionType.HOLD] = n_investors
 
         # Validate that investor identifiers are a subset of the network nodes.
         assert set(range(n_investors)).issubset(self.network.nodes()), (
             "Investor IDs (0..n-1) do not match the graph nodes."
         )
 
-        # Initial network metrics prior to any agent decisions.
-        self.net_metrics = compute_network_metrics(self.network)
+        # CSR adjacency over investors 0..n-1 followed by any other nodes,
+        # so that row/column i is investor i. Non-investor nodes always HOLD.
+        investor_ids = set(range(n_investors))
+        self._csr_nodes = list(range(n_investors)) + [u for u in G.nodes if u not in investor_ids]
+        self._node_actions = np.zeros(len(self._csr_nodes), dtype=np.int8)
+
+        # Last published ActionType code per investor (HOLD initially). The
+        # array is the authoritative record; ``last_actions`` is a read-only
+        # mapping view over it for code that expects ActionType values.
+        self.last_actions_arr = self._node_actions[:n_investors]
+        self.last_actions: Mapping[int, ActionType] = _ActionCodesView(self.last_actions_arr)
+        self._investor_rows = np.arange(n_investors)
+        self._action_onehot = np.zeros((len(self._csr_nodes), len(ActionType)))
+        self._action_onehot[n_investors:, ActionType.HOLD] = 1.0
+        self._rebuild_adj_cache()
+
+        # Initial network metrics prior to any agent decisions. Topology is
+        # fixed, so the static part is computed once; weight-dependent
+        # metrics are refreshed every ``_metrics_every`` steps.
+        self._metrics_every = 10
+        self._static_metrics = compute_static_metrics(self.network)
+        self._topology_dirty = False
+        # Louvain partition and modularity, kept until weights or topology
+        # change (``None`` when it must be recomputed).
+        self._communities = None
+        self._refresh_dynamic_metrics()
 
         # Record the initial state for downstream analysis.
-        self.price_history.append(self.market.price)
-        self.net_metrics_history.append({
-            "t": self.schedule.time,
-            "avg_degree": self.net_metrics["avg_degree"],
-            "avg_clustering": self.net_metrics["avg_clustering"],
-            "modularity": self.net_metrics["modularity"],
-        })
+        self._record_history()
+
+    @property
+    def history(self) -> np.ndarray:
+        """Structured array of the recorded steps (``t``, ``price`` and metrics)."""
+        return self._history[:self._history_len]
+
+    @property
+    def price_history(self) -> np.ndarray:
+        """Recorded prices, one per step (a view on ``history``)."""
+        return self.history["price"]
+
+    @property
+    def net_metrics_history(self) -> np.ndarray:
+        """Recorded aggregate network metrics per step (a view on ``history``).
+
+        Each row can be indexed by field name like the former dictionaries:
+        ``t``, ``avg_degree``, ``avg_clustering`` and ``modularity``.
+        """
+        return self.history[_NET_METRIC_FIELDS]
+
+    def _record_history(self) -> None:
+        """Append the current price and network metrics to ``history``."""
+        if self._history_len == len(self._history):
+            grown = np.zeros(2 * len(self._history), dtype=_HISTORY_DTYPE)
+            grown[:self._history_len] = self._history
+            self._history = grown
+        m = self.net_metrics
+        self._history[self._history_len] = (
+            self.schedule.time,
+            self.market.price,
+            m["avg_degree"],
+            m["avg_clustering"],
+            m["modularity"],
+        )
+        self._history_len += 1
 
     def _assign_profile(self, i: int):
         """Assign a simple behavioural profile and risk aversion parameter.
@@ -95,20 +213,210 @@ class MarketModel(Model):
         This is intentionally lightweight and can be replaced by richer
         profiling schemes without affecting the surrounding architecture.
         """
-        if i % 3 == 0:
-            return "risk_averse", 0.8
-        if i % 3 == 1:
-            return "moderate", 0.5
-        return "speculative", 0.2
+        return self._PROFILES[i % len(self._PROFILES)]
 
-    def get_neighbor_signals(self, node_id: int):
+    def get_neighbor_signals(self, node_id: int) -> np.ndarray:
         """Return the distribution of neighbour actions for a given investor.
 
         The distribution is computed as a weighted histogram over the
         last actions of the investor's network neighbours, where edge
-        weights in the NetworkX graph encode influence or trust.
+        weights encode influence or trust. It reads the cached CSR
+        snapshot of the network; isolated investors get a shared all-zero
+        distribution.
+
+        This is the per-investor lookup used outside the batched
+        ``decide`` stage (for example by ``InvestorAgent.observe`` when
+        called off-schedule, or by analysis code); the simulation step
+        itself uses ``_all_neighbor_signals``.
+        """
+        if self._indptr[node_id] == self._indptr[node_id + 1]:
+            return NO_NEIGHBOR_SIGNALS
+        return neighbor_action_distribution(
+            self._indptr, self._indices, self._weights, self._node_actions, node_id
+        )
+
+    def _rebuild_adj_cache(self) -> None:
+        """Snapshot the weighted network as CSR arrays.
+
+        Hot paths read neighbours and trust weights from ``_indptr``,
+        ``_indices`` and ``_weights`` (the arrays of ``_adj_csr``) instead
+        of NetworkX's dict-of-dicts. Trust weights are then evolved in
+        place on the snapshot, which must be rebuilt whenever the topology
+        changes.
         """
-        return neighbor_action_distribution(self.network, node_id, self.last_actions)
+        self._adj_csr = nx.to_scipy_sparse_array(
+            self.network, nodelist=self._csr_nodes, weight="weight", format="csr"
+        )
+        self._indptr = self._adj_csr.indptr
+        self._indices = self._adj_csr.indices
+        self._weights = self._adj_csr.data
+
+        # Bring every trust weight into the bounds enforced by the updates
+        # (which only re-clip the edges they change); the graph is synced
+        # later if any weight had to be clamped.
+        clipped = np.clip(self._weights, TRUST_W_MIN, TRUST_W_MAX)
+        out_of_range = not np.array_equal(clipped, self._weights)
+        self._weights[:] = clipped
+        self._adj_wsum = np.asarray(self._adj_csr.sum(axis=1)).ravel()
+
+        # Endpoints of every stored CSR entry (both directions of each
+        # edge); ``_weights`` is the matching, in-place updatable weight array.
+        self._edge_u = np.repeat(
+            np.arange(len(self._csr_nodes)), np.diff(self._indptr)
+        )
+        self._edge_v = self._indices
+        self._weights_dirty = out_of_range
+
+        # Degree centrality per CSR node (degree / (N - 1), as in NetworkX).
+        n_nodes = len(self._csr_nodes)
+        scale = 1.0 / (n_nodes - 1) if n_nodes > 1 else 1.0
+        self._deg_arr = np.diff(self._indptr) * scale
+
+    def sync_network_weights(self) -> None:
+        """Write the CSR trust weights back into ``self.network``.
+
+        Trust updates are applied to the CSR snapshot, which is the
+        authoritative copy of the weights; the NetworkX graph is only
+        refreshed here, before code that reads it (such as the network
+        metrics) runs.
+        """
+        if not self._weights_dirty:
+            return
+        upper = self._edge_u <= self._edge_v
+        nodes = self._csr_nodes
+        for u, v, w in zip(
+            self._edge_u[upper].tolist(),
+            self._edge_v[upper].tolist(),
+            self._weights[upper].tolist(),
+        ):
+            self.network[nodes[u]][nodes[v]]["weight"] = w
+        self._weights_dirty = False
+
+    def rewire_network(
+        self,
+        agent_score: Dict[int, float],
+        prob: float = 0.01,
+        rng: Optional[random.Random] = None,
+    ) -> bool:
+        """Rewire ``self.network`` towards high-scoring agents.
+
+        Syncs the evolved trust weights into the graph first, so that
+        ``rewire_by_performance`` drops the currently weakest edges and
+        the rebuilt CSR snapshot keeps the surviving weights. Uses the
+        model's random generator unless ``rng`` is given. Returns whether
+        the topology changed.
+        """
+        self.sync_network_weights()
+        changed = rewire_by_performance(
+            self.network, rng if rng is not None else self.random, agent_score, prob=prob
+        )
+        if changed:
+            self.mark_topology_changed()
+        return changed
+
+    def mark_topology_changed(self) -> None:
+        """Flag that edges of ``self.network`` were added or removed.
+
+        Call after mutating the graph; ``rewire_network`` does so itself.
+        The graph must have been brought up to date with
+        ``sync_network_weights`` before it was mutated, otherwise the
+        trust weights evolved since the last sync would be lost. The CSR
+        snapshot, degree centralities and static metrics are then rebuilt
+        once at the start of the next step instead of every step.
+        """
+        self._check_weights_synced()
+        self._topology_dirty = True
+
+    def _check_weights_synced(self) -> None:
+        """Raise if the CSR holds trust weights not yet written to the graph."""
+        if self._weights_dirty:
+            raise RuntimeError(
+                "Trust weights have evolved since the last sync; call "
+                "sync_network_weights() before changing the network topology."
+            )
+
+    def _refresh_dynamic_metrics(self) -> None:
+        """Recompute the weight-dependent metrics from the synced graph.
+
+        The community partition is only searched again if the weights or
+        the topology changed since it was last computed.
+        """
+        self.sync_network_weights()
+        if self._communities is None:
+            self._communities = detect_communities(self.network)
+        self.net_metrics = compute_dynamic_metrics(
+            self.network, self._static_metrics, self._communities
+        )
+
+    def _refresh_topology(self) -> None:
+        """Rebuild the topology-dependent caches after a graph change."""
+        self._check_weights_synced()
+        self._rebuild_adj_cache()
+        self._static_metrics = compute_static_metrics(self.network)
+        self._communities = None
+        # Degree-based entries of the current metrics follow the new graph
+        # immediately; weighted ones wait for the next periodic refresh.
+        self.net_metrics = {**self.net_metrics, **self._static_metrics}
+        self._topology_dirty = False
+
+    def _all_neighbor_signals(self) -> np.ndarray:
+        """Return neighbour action distributions for all investors.
+
+        Equivalent to ``get_neighbor_signals`` for every investor, but
+        computed as a single sparse product between the weighted
+        adjacency and a one-hot encoding of the last published actions.
+        """
+        n = self.investor_soa.n
+        onehot = self._action_onehot
+        onehot[:n] = 0.0
+        onehot[self._investor_rows, self.last_actions_arr] = 1.0
+
+        totals = (self._adj_csr @ onehot)[:n]
+        wsum = self._adj_wsum[:n, None]
+        return np.divide(totals, wsum, out=np.zeros_like(totals), where=wsum > 1e-12)
+
+    def decide_investors(self) -> None:
+        """Compute the current step's decisions for all investors at once.
+
+        Called by every investor at the start of its ``decide`` stage; only
+        the first call in a step does any work (guarded by a lock, as the
+        stage may run on a thread pool). Because the analyst is
+        scheduled first, its latest recommendation is already published.
+        Social inputs are taken from the previous step's actions, so all
+        investors react to the same snapshot of their neighbourhood.
+        """
+        t = self.schedule.time
+        if self._decided_at == t:
+            return
+        # Investors may decide concurrently: the first caller computes the
+        # decisions while the others wait for them to be published.
+        with self._decide_lock:
+            if self._decided_at == t:
+                return
+
+            soa = self.investor_soa
+            soa.signals[:] = self._all_neighbor_signals()
+
+            soa.decide(self.market.last_return, self.analyst_value())
+
+            # Publish the discrete actions for social diffusion on the network.
+            self.last_actions_arr[:] = soa.action
+            self.action_counts[:] = np.bincount(soa.action, minlength=len(ActionType))
+            self._decided_at = t
+
+    def decided_this_step(self) -> bool:
+        """Whether ``decide_investors`` has run for the current step."""
+        return self._decided_at == self.schedule.time
+
+    def analyst_value(self) -> float:
+        """Return the published analyst recommendation as +1 (BUY), -1 (SELL) or 0."""
+        rec = getattr(self, "analyst_recommendation", None)
+        if rec is not None:
+            if rec.intended_action == ActionType.BUY:
+                return 1.0
+            if rec.intended_action == ActionType.SELL:
+                return -1.0
+        return 0.0
 
     def get_latest_analyst_signal(self) -> Optional[str]:
         """Return the most recent textual recommendation from the analyst."""
@@ -122,30 +430,41 @@ class MarketModel(Model):
         records time series for analysis, and evolves trust weights based
         on realised investor performance.
         """
+        if self._topology_dirty:
+            self._refresh_topology()
+
         self.schedule.step()
 
-        # (A) Update network-level metrics derived from the current graph.
-        self.net_metrics = compute_network_metrics(self.network)
+        # (A) Periodically refresh the weight-dependent network metrics;
+        #     in between, the most recent values are carried forward.
+        if self.schedule.time % self._metrics_every == 0:
+            self._refresh_dynamic_metrics()
 
         # (B) Append price and network metrics to the simulation history.
-        self.price_history.append(self.market.price)
-        self.net_metrics_history.append({
-            "t": self.schedule.time,
-            "avg_degree": self.net_metrics["avg_degree"],
-            "avg_clustering": self.net_metrics["avg_clustering"],
-            "modularity": self.net_metrics["modularity"],
-        })
+        self._record_history()
 
         # (C) Update trust weights based on investors' step-level PnL
         #     to obtain an evolving influence network.
-        pnl_map: Dict[int, float] = {}
-        for a in self.schedule.agents:
-            # Only investor agents have a non-trivial Outcome with PnL;
-            # the analyst contributes a zero or missing PnL.
-            if hasattr(a, "_outcome") and getattr(a, "_outcome") is not None:
-                pnl_map[a.unique_id] = a._outcome.pnl
-
-        update_trust_weights(self.network, pnl_map)
+        #     Weights are updated in place on the CSR snapshot.
+        #     Only investors (CSR rows 0..n-1) carry a PnL; the analyst and
+        #     any non-investor graph nodes contribute zero.
+        pnl = np.zeros(len(self._csr_nodes))
+        for a in self._investors:
+            if a._outcome is not None:
+                pnl[a.unique_id] = a._outcome.pnl
+
+        if update_trust_weights(self._edge_u, self._edge_v, self._weights, pnl):
+            self._adj_wsum = np.asarray(self._adj_csr.sum(axis=1)).ravel()
+            self._weights_dirty = True
+            self._communities = None
+
+    def close(self) -> None:
+        """Release the scheduler's worker threads at the end of a run.
+
+        Only needed when the model was created with ``max_workers``; batch
+        runs should call it for every model they discard.
+        """
+        self.schedule.close()
 
     def market_global_update(self) -> None:
         """Hook invoked by the scheduler during the 'market' stage.
@@ -164,14 +483,9 @@ class MarketModel(Model):
         sell impulses and scales them by degree centrality plus a small
         baseline. This makes highly connected agents exert stronger
         price impact, reflecting their central position in the social
-        network.
+        network. Computed as a dot product of the investors' centrality
+        weights with the signs of their last published actions.
         """
-        deg_cent = self.net_metrics["degree_centrality"]
-        flow = 0.0
-        for node, a in self.last_actions.items():
-            w = float(deg_cent.get(node, 0.0)) + 0.1
-            if a == ActionType.BUY:
-                flow += w
-            elif a == ActionType.SELL:
-                flow -= w
-        return flow
+        n = self.investor_soa.n
+        signs = _FLOW_SIGN[self.last_actions_arr]
+        return float(np.dot(self._deg_arr[:n] + 0.1, signs))
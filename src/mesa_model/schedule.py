@@ -8,13 +8,59 @@ experience market updates, then settle portfolios, and only afterwards
 engage in reflective learning.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import Any, Callable, Dict, List, Optional
+
 from mesa.time import BaseScheduler
 
 
 class StagedScheduler(BaseScheduler):
-    """Scheduler that iterates agents through named behavioural stages."""
+    """Scheduler that iterates agents through named behavioural stages.
+
+    When ``max_workers`` is given, the agent methods of the stages listed
+    in ``parallel_stages`` are dispatched to a thread pool of that size.
+    These stages only touch each agent's own state (for example its
+    memory) besides reading shared model state. Consecutive agents of
+    the same type form a batch; batches still run in scheduling order, so
+    the analyst (added first) publishes its recommendation before any
+    investor decides, while the investors themselves run concurrently.
+    """
 
     stages = ("decide", "market", "settle", "reflect")
+    parallel_stages = ("decide", "reflect")
+
+    def __init__(self, model, max_workers: Optional[int] = None) -> None:
+        """Create the scheduler, optionally with a worker pool size."""
+        super().__init__(model)
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Bound stage methods per stage, in scheduling order; maintained by
+        # ``add``/``remove``. Same-type batches for the parallel stages are
+        # derived from them lazily.
+        self._stage_methods: Dict[str, List[Callable[[], Any]]] = {
+            stage: [] for stage in self.stages
+        }
+        self._stage_batches: Optional[Dict[str, List[List[Callable[[], Any]]]]] = None
+
+    def add(self, agent) -> None:
+        """Add an agent and register its bound stage methods."""
+        super().add(agent)
+        for stage in self.stages:
+            method = getattr(agent, stage, None)
+            if callable(method):
+                self._stage_methods[stage].append(method)
+        self._stage_batches = None
+
+    def remove(self, agent) -> None:
+        """Remove an agent and drop its stage methods."""
+        super().remove(agent)
+        for stage, methods in self._stage_methods.items():
+            self._stage_methods[stage] = [
+                m for m in methods if getattr(m, "__self__", None) is not agent
+            ]
+        self._stage_batches = None
 
     def step(self) -> None:
         """Advance the model by one step across all defined stages.
@@ -25,18 +71,71 @@ class StagedScheduler(BaseScheduler):
         whose name matches the current stage if it is defined. This
         pattern supports agentic loops where decision, execution, and
         learning are cleanly separated in time.
+
+        Agents are dispatched through the bound-method tables built in
+        ``add``; no stage adds or removes agents.
         """
+        stage_methods = self._stage_methods
+
         for stage in self.stages:
             # Invoke a single global market hook once per step.
             if stage == "market":
                 if hasattr(self.model, "market_global_update"):
                     self.model.market_global_update()
 
+            methods = stage_methods[stage]
+
+            # Independent stages may run concurrently, one batch of
+            # same-type agents at a time; list() waits for all calls and
+            # re-raises the first exception, if any.
+            if self.max_workers and stage in self.parallel_stages:
+                for batch in self._batches()[stage]:
+                    if len(batch) == 1:
+                        batch[0]()
+                    else:
+                        list(self._pool().map(lambda m: m(), batch))
+                continue
+
             # Invoke the stage-specific method on each agent, if present.
-            for agent in list(self.agents):
-                method = getattr(agent, stage, None)
-                if callable(method):
-                    method()
+            for method in methods:
+                method()
 
         self.steps += 1
         self.time += 1
+
+    def _batches(self) -> Dict[str, List[List[Callable[[], Any]]]]:
+        """Return the parallel stages' methods split into same-type batches."""
+        if self._stage_batches is None:
+            self._stage_batches = {
+                stage: [
+                    list(batch)
+                    for _, batch in groupby(
+                        self._stage_methods[stage],
+                        key=lambda m: type(getattr(m, "__self__", None)),
+                    )
+                ]
+                for stage in self.parallel_stages
+            }
+        return self._stage_batches
+
+    def _pool(self) -> ThreadPoolExecutor:
+        """Return the worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started.
+
+        Waits for running calls to finish. The scheduler stays usable; a
+        new pool is created if a parallel stage runs again.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __del__(self) -> None:
+        # Safety net for schedulers that are dropped without ``close()``.
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
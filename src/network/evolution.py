@@ -3,15 +3,22 @@ import random
 """Evolutionary mechanisms for trust weights and network structure."""
 
 import networkx as nx
+import numpy as np
+
+# Default bounds of the trust weights.
+TRUST_W_MIN = 0.05
+TRUST_W_MAX = 2.0
 
 
 def update_trust_weights(
-    G: nx.Graph,
-    agent_pnl: dict[int, float],
+    edge_u: np.ndarray,
+    edge_v: np.ndarray,
+    weights: np.ndarray,
+    pnl: np.ndarray,
     lr: float = 0.05,
-    w_min: float = 0.05,
-    w_max: float = 2.0,
-):
+    w_min: float = TRUST_W_MIN,
+    w_max: float = TRUST_W_MAX,
+) -> bool:
     """Adapt edge weights based on recent agent performance.
 
     The update rule increases the trust weight on edges adjacent to
@@ -19,14 +26,25 @@ def update_trust_weights(
     with negative performance, while enforcing lower and upper bounds.
     This yields an endogenous, performance-driven evolution of social
     influence in the network.
+
+    Edges are given as parallel arrays of endpoint indices (``edge_u``,
+    ``edge_v``) and ``weights``, which is updated in place; ``pnl`` holds
+    the realised PnL per node index (zero for agents without one). Only
+    edges with at least one endpoint of non-zero PnL can change, so only
+    those are updated and re-clipped; ``MarketModel`` clips every weight
+    into the bounds once, when it snapshots the graph. Returns whether
+    any weight was updated.
     """
-    for u, v, data in G.edges(data=True):
-        w = float(data.get("weight", 1.0))
-        # Symmetric performance signal from the two incident agents.
-        signal = 0.5 * (agent_pnl.get(u, 0.0) + agent_pnl.get(v, 0.0))
-        direction = 1.0 if signal > 0 else -1.0 if signal < 0 else 0.0
-        w = w * (1.0 + lr * direction)
-        data["weight"] = max(w_min, min(w_max, w))
+    active = pnl != 0.0
+    if not active.any():
+        return False
+    idx = np.flatnonzero(active[edge_u] | active[edge_v])
+
+    # Symmetric performance signal from the two incident agents.
+    signal = 0.5 * (pnl[edge_u[idx]] + pnl[edge_v[idx]])
+    w = weights[idx] * (1.0 + lr * np.sign(signal))
+    weights[idx] = np.clip(w, w_min, w_max)
+    return idx.size > 0
 
 
 def rewire_by_performance(
@@ -34,14 +52,20 @@ def rewire_by_performance(
     rng: random.Random,
     agent_score: dict[int, float],
     prob: float = 0.01,
-):
+) -> bool:
     """Optionally rewire edges towards high-performing agents.
 
     With a small probability per node, the algorithm removes the weakest
     existing connection and creates a new edge to a high-scoring agent
     to capture performance-driven reallocation of attention or trust.
+    Returns whether the topology of ``G`` changed.
     """
+    changed = False
     nodes = list(G.nodes())
+    pos = {x: i for i, x in enumerate(nodes)}
+    scores = np.fromiter(
+        (agent_score.get(x, 0.0) for x in nodes), dtype=np.float64, count=len(nodes)
+    )
     for u in nodes:
         if rng.random() > prob:
             continue
@@ -51,10 +75,15 @@ def rewire_by_performance(
         # Remove the weakest existing edge for node u.
         v_remove = min(nbrs, key=lambda v: float(G[u][v].get("weight", 1.0)))
         G.remove_edge(u, v_remove)
+        changed = True
 
         # Connect to a high-scoring candidate (not self, not already connected).
-        candidates = [x for x in nodes if x != u and not G.has_edge(u, x)]
-        if not candidates:
+        mask = np.ones(len(nodes), dtype=bool)
+        mask[pos[u]] = False
+        mask[[pos[x] for x in G.neighbors(u)]] = False
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
             continue
-        v_add = max(candidates, key=lambda x: agent_score.get(x, 0.0))
+        v_add = nodes[candidates[np.argmax(scores[candidates])]]
         G.add_edge(u, v_add, weight=rng.uniform(0.2, 1.0))
+    return changed
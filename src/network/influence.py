@@ -1,30 +1,66 @@
 from __future__ import annotations
 
-"""Social influence utilities operating on the investor network."""
+"""Social influence utilities operating on the investor network.
 
-import networkx as nx
-from typing import Dict
+``neighbor_action_distribution`` answers single-node queries (see
+``MarketModel.get_neighbor_signals``); the simulation's decision stage
+computes all investors at once with a sparse product instead.
+"""
+
+import numpy as np
+
+from ..core._jit import njit
 from ..core.types import ActionType
 
+_BUY = int(ActionType.BUY)
+_SELL = int(ActionType.SELL)
+_HOLD = int(ActionType.HOLD)
 
-def neighbor_action_distribution(G: nx.Graph, node: int, last_actions: Dict[int, ActionType]) -> Dict[ActionType, float]:
-    """Compute the weighted distribution of neighbour actions for a node.
 
-    The function aggregates the latest discrete actions of a node's
-    neighbours, weighting each contribution by the trust weight on the
-    corresponding edge. The resulting normalised distribution serves as
-    a compact representation of local social pressure on the agent.
+@njit(cache=True)
+def _accumulate_neighbor_actions(indptr, indices, weights, actions, node, out):
+    """Write the normalised neighbour action weights of ``node`` to ``out``.
+
+    Per-action totals are accumulated in scalar locals and written once;
+    ``out`` is set to zero when the total weight is negligible.
     """
-    totals = {ActionType.BUY: 0.0, ActionType.SELL: 0.0, ActionType.HOLD: 0.0}
+    hold = buy = sell = 0.0
     wsum = 0.0
-
-    for nbr in G.neighbors(node):
-        w = float(G[node][nbr].get("weight", 1.0))
-        a = last_actions.get(nbr, ActionType.HOLD)
-        totals[a] += w
+    for k in range(indptr[node], indptr[node + 1]):
+        w = weights[k]
+        a = actions[indices[k]]
+        if a == _BUY:
+            buy += w
+        elif a == _SELL:
+            sell += w
+        else:
+            hold += w
         wsum += w
+    if wsum > 1e-12:
+        out[_HOLD] = hold / wsum
+        out[_BUY] = buy / wsum
+        out[_SELL] = sell / wsum
+    else:
+        out[_HOLD] = out[_BUY] = out[_SELL] = 0.0
+    return out
+
 
-    if wsum <= 1e-12:
-        return {k: 0.0 for k in totals}
+def neighbor_action_distribution(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    actions: np.ndarray,
+    node: int,
+) -> np.ndarray:
+    """Compute the weighted distribution of neighbour actions for a node.
 
-    return {k: v / wsum for k, v in totals.items()}
+    The network is given as a CSR snapshot (``indptr``, ``indices``,
+    ``weights``) and ``actions`` holds the latest ``ActionType`` code of
+    every node. The function aggregates the actions of ``node``'s
+    neighbours, weighting each contribution by the trust weight on the
+    corresponding edge. The resulting normalised distribution, a
+    length-3 array indexed by ``ActionType``, serves as a compact
+    representation of local social pressure on the agent.
+    """
+    out = np.empty(len(ActionType))
+    return _accumulate_neighbor_actions(indptr, indices, weights, actions, node, out)
@@ -3,35 +3,105 @@ from __future__ import annotations
 """Computation of descriptive metrics for the social network."""
 
 import networkx as nx
-from networkx.algorithms.community import greedy_modularity_communities, modularity
-from typing import Dict, Any
+import numpy as np
+from networkx.algorithms.community import louvain_communities, modularity
+from typing import Dict, Any, List, Optional, Tuple
 
+def detect_communities(G: nx.Graph, seed: int = 0) -> Tuple[List[frozenset], float]:
+    """Return a Louvain partition of ``G`` and its weighted modularity.
 
-def compute_network_metrics(G: nx.Graph) -> Dict[str, Any]:
-    """Compute centrality, clustering, and modularity metrics for a graph.
+    A fixed ``seed`` keeps the partition reproducible. Callers that know
+    when the graph's weights or topology last changed can keep the result
+    and pass it back to ``compute_dynamic_metrics`` to skip the search.
+    """
+    comms = [frozenset(c) for c in louvain_communities(G, weight="weight", seed=seed)]
+    mod = modularity(G, comms, weight="weight") if comms else 0.0
+    return comms, mod
 
-    The returned dictionary includes both aggregate statistics (such as
-    average degree and average clustering coefficient) and node-level
-    quantities (degree centrality, local clustering, detected
-    communities). These metrics are used to analyse how network
-    structure relates to herding, contagion, and other emergent market
-    phenomena.
+
+def weighted_clustering(G: nx.Graph) -> Dict[Any, float]:
+    """Return the Onnela weighted clustering coefficient of every node.
+
+    Equivalent to ``nx.clustering(G, weight="weight")`` but evaluated with
+    sparse matrix products: with ``W`` the adjacency matrix of weights
+    normalised by the maximum weight and raised elementwise to ``1/3``,
+    the weighted triangle intensity of node ``i`` is ``(W @ W @ W)[i, i]``.
+    Only the diagonal is needed, so it is taken as the row sums of
+    ``(W @ W) * W``.
     """
-    deg_cent = nx.degree_centrality(G)
-    clustering = nx.clustering(G, weight="weight")
+    nodes = list(G)
+    if not nodes:
+        return {}
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight="weight", format="csr")
+    if A.diagonal().any():  # self-loops do not form triangles
+        A.setdiag(0)
+        A.eliminate_zeros()
+    deg = np.diff(A.indptr)
+
+    max_w = A.data.max() if A.nnz else 0.0
+    if max_w <= 0:
+        return dict.fromkeys(nodes, 0.0)
+    W = A.copy()
+    W.data = np.cbrt(W.data / max_w)
+
+    tri = np.asarray((W @ W).multiply(W).sum(axis=1)).ravel()
+    denom = deg * (deg - 1.0)
+    coef = np.divide(tri, denom, out=np.zeros(len(nodes)), where=denom > 0)
+    return dict(zip(nodes, coef.tolist()))
 
-    # Communities identified via greedy modularity maximisation.
-    comms = list(greedy_modularity_communities(G, weight="weight"))
-    mod = modularity(G, comms, weight="weight") if comms else 0.0
 
+def compute_static_metrics(G: nx.Graph) -> Dict[str, Any]:
+    """Compute the metrics that depend only on the graph topology.
+
+    Degree-based quantities are invariant while edges are neither added
+    nor removed, so callers can compute them once and reuse them for as
+    long as the topology stays fixed.
+    """
+    deg_cent = nx.degree_centrality(G)
     return {
         "n": G.number_of_nodes(),
         "m": G.number_of_edges(),
         "avg_degree": sum(dict(G.degree()).values()) / max(1, G.number_of_nodes()),
         "avg_degree_centrality": sum(deg_cent.values()) / max(1, len(deg_cent)),
+        "degree_centrality": deg_cent,
+    }
+
+
+def compute_dynamic_metrics(
+    G: nx.Graph,
+    static: Dict[str, Any],
+    communities: Optional[Tuple[List[frozenset], float]] = None,
+) -> Dict[str, Any]:
+    """Compute the weight-dependent metrics and merge them into ``static``.
+
+    Weighted clustering and the modularity-based community partition
+    change as trust weights evolve, so they are recomputed on every call
+    unless ``communities`` supplies a still-valid result of
+    ``detect_communities``. ``static`` must come from
+    ``compute_static_metrics`` on the same topology; it is not modified.
+    """
+    clustering = weighted_clustering(G)
+
+    # Communities identified via Louvain modularity maximisation.
+    comms, mod = communities if communities is not None else detect_communities(G)
+
+    return {
+        **static,
         "avg_clustering": sum(clustering.values()) / max(1, len(clustering)),
         "modularity": mod,
-        "degree_centrality": deg_cent,
         "clustering": clustering,
         "communities": comms,
     }
+
+
+def compute_network_metrics(G: nx.Graph) -> Dict[str, Any]:
+    """Compute centrality, clustering, and modularity metrics for a graph.
+
+    The returned dictionary includes both aggregate statistics (such as
+    average degree and average clustering coefficient) and node-level
+    quantities (degree centrality, local clustering, detected
+    communities). These metrics are used to analyse how network
+    structure relates to herding, contagion, and other emergent market
+    phenomena.
+    """
+    return compute_dynamic_metrics(G, compute_static_metrics(G))
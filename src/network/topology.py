@@ -3,6 +3,8 @@ from __future__ import annotations
 """Network topology construction utilities for the social graph."""
 
 import networkx as nx
+import numpy as np
+from itertools import cycle
 from typing import Literal, Optional
 import random
 
@@ -42,17 +44,24 @@ def build_network(
         sizes[0] += n - sum(sizes)
         # Probability matrix with higher intra-community than inter-community density.
         pin, pout = min(0.35, 1.0), max(0.02, p)
-        probs = [[pin if i == j else pout for j in range(communities)] for i in range(communities)]
-        G = nx.stochastic_block_model(sizes, probs, seed=seed)
+        probs = np.full((communities, communities), pout, dtype=np.float64)
+        np.fill_diagonal(probs, pin)
+        G = nx.stochastic_block_model(sizes, probs.tolist(), seed=seed)
     else:
         raise ValueError(f"Unknown topology={topology}")
 
-    # Ensure minimum connectivity by attaching isolated nodes to random neighbours.
+    # Ensure minimum connectivity by attaching isolated nodes to random neighbours,
+    # drawn from a single shuffled pool of (preferably non-isolated) nodes.
     isolates = list(nx.isolates(G))
-    if isolates:
-        nodes = list(G.nodes())
+    if isolates and G.number_of_nodes() > 1:
+        isolated = set(isolates)
+        pool = [x for x in G.nodes() if x not in isolated] or list(G.nodes())
+        rng.shuffle(pool)
+        targets = cycle(pool)
         for u in isolates:
-            v = rng.choice([x for x in nodes if x != u])
+            v = next(targets)
+            while v == u:
+                v = next(targets)
             G.add_edge(u, v)
 
     # Initialise influence/trust weights on all edges.